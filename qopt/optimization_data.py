@@ -28,6 +28,9 @@ Classes
 :class:`OptimizationSummary`
     Describes the whole information gained during an optimization run.
 
+:class:`ArrayLog`
+    Records arrays of equal shape in a preallocated array.
+
 Notes
 -----
 The implementation was inspired by the optimal control package of QuTiP [1]_
@@ -43,6 +46,8 @@ References
 
 from typing import Dict, List
 
+import numpy as np
+
 
 class OptimizationResult(object):
     """
@@ -71,11 +76,19 @@ class OptimizationResult(object):
         3: minimal step size termination condition is satisfied.
         4: Both 2 and 3 termination conditions are satisfied.
 
-    final_cost : float
-        Value of the cost functions after the optimization.
+    final_cost : float or array
+        Value of the cost functions after the optimization, multiplied by the
+        cost function weights of the optimizer. It is given as the optimizer
+        minimizes it: the weighted costs for the least squares optimization,
+        their sum for the scalar minimization and the norm of the weighted
+        costs for the simulated annealing. If the optimization is terminated
+        by the wall time, it is given for the best parameters found.
 
     final_grad_norm : float
-        Norm of the gradient after the optimization.
+        Norm of the gradient after the optimization. For the least squares
+        optimization, this is the first order optimality measure reported by
+        scipy, i.e. the infinity norm of the gradient, scaled to account for
+        the bounds.
 
     num_iter : integer
         Number of iterations in the optimization algorithm.
@@ -185,6 +198,10 @@ class OptimizationSummary(object):
     parameters : List[array]
         Optimization parameters during the optimization.
 
+    If no lists are given for the costs, gradients and parameters, then they
+    are recorded in instances of `ArrayLog`, which copy the values into
+    preallocated arrays and behave like lists of arrays otherwise.
+
     """
 
     def __init__(self, indices=None, iter_num=0, costs=None, gradients=None,
@@ -192,14 +209,95 @@ class OptimizationSummary(object):
         self.indices = indices
         self.iter_num = iter_num
         if costs is None:
-            self.costs = []
+            self.costs = ArrayLog()
         else:
             self.costs = costs
         if gradients is None:
-            self.gradients = []
+            self.gradients = ArrayLog()
         else:
             self.gradients = gradients
         if parameters is None:
-            self.parameters = []
+            self.parameters = ArrayLog()
         else:
             self.parameters = parameters
+
+
+class ArrayLog(object):
+    """Records arrays of equal shape in a preallocated array.
+
+    Appending copies the array into the next row of a buffer, whose size is
+    doubled when it is full. The recorded arrays can be accessed like a list
+    of arrays or converted to a single array by numpy.asarray, both without
+    copying.
+
+    Parameters
+    ----------
+    capacity : int
+        Number of arrays for which memory is allocated initially.
+
+    """
+
+    def __init__(self, capacity: int = 64):
+        self._capacity = capacity
+        self._buffer = None
+        self._length = 0
+
+    def append(self, array):
+        """Copies an array into the log.
+
+        Parameters
+        ----------
+        array : array_like
+            The array to be recorded. Its shape must be the same as of the
+            first recorded array.
+
+        Raises
+        ------
+        ValueError
+            If the shape of the array differs from the recorded arrays.
+
+        """
+        array = np.asarray(array)
+        if self._buffer is None:
+            self._buffer = np.empty((self._capacity, ) + array.shape,
+                                    dtype=array.dtype)
+        elif array.shape != self._buffer.shape[1:]:
+            raise ValueError('The array of shape ' + str(array.shape)
+                             + ' does not match the recorded arrays of shape '
+                             + str(self._buffer.shape[1:]) + '.')
+        if self._length == self._buffer.shape[0]:
+            buffer = np.empty(
+                (max(2 * self._length, 1), ) + self._buffer.shape[1:],
+                dtype=self._buffer.dtype)
+            buffer[:self._length] = self._buffer
+            self._buffer = buffer
+        self._buffer[self._length] = array
+        self._length += 1
+
+    @property
+    def data(self) -> np.ndarray:
+        """The recorded arrays stacked along the first axis. """
+        if self._buffer is None:
+            return np.empty((0, ))
+        return self._buffer[:self._length]
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, item):
+        return self.data[item]
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __array__(self, dtype=None, copy=None):
+        if copy:
+            return np.array(self.data, dtype=dtype)
+        return np.asarray(self.data, dtype=dtype)
+
+    def __getstate__(self):
+        # only the recorded arrays are pickled
+        state = self.__dict__.copy()
+        if self._buffer is not None:
+            state['_buffer'] = self.data.copy()
+        return state
@@ -52,11 +52,14 @@ References
 
 """
 
+import contextlib
 import numpy as np
+import random
 import scipy
 import scipy.optimize
 import time
 from abc import ABC, abstractmethod
+from multiprocessing import Pool
 from typing import Dict, Optional, Callable, List, Union, Sequence
 
 from qopt import optimization_data, simulator, performance_statistics
@@ -96,6 +99,15 @@ class Optimizer(ABC):
     use_jacobian_function: bool, optional
         If set to true, then the jacobians are calculated analytically.
 
+    processes: int, optional
+        If the jacobians are not calculated analytically and an integer other
+        than 1 is given, then the jacobians are approximated by symmetric
+        finite differences evaluated in this number of parallel processes.
+        If None then cpu_count() is called to use all cores available. If 1
+        then the finite differences of the scipy optimizer are used. Note
+        that parallel processes can not be started from within
+        `parallel.run_optimization_parallel`. Defaults to 1.
+
     """
 
     def __init__(
@@ -104,9 +116,11 @@ class Optimizer(ABC):
             termination_cond: Optional[Dict] = None,
             save_intermediary_steps: bool = True,
             cost_fktn_weights: Optional[Sequence[float]] = None,
-            use_jacobian_function=True):
+            use_jacobian_function=True,
+            processes: Optional[int] = 1):
         self.system_simulator = system_simulator
         self.use_jacobian_function = use_jacobian_function
+        self.processes = processes
         if termination_cond is None:
             self.termination_conditions = default_termination_conditions
         else:
@@ -115,8 +129,11 @@ class Optimizer(ABC):
         self.optim_iter_summary = None
         self.pulse_shape = ()
 
+        self._pool = None
+
         self._opt_start_time = 0
         self._min_costs = np.inf
+        self._min_objective = np.inf
         self._min_costs_par = None
         self._n_cost_fkt_eval = 0
         self._n_jac_fkt_eval = 0
@@ -152,31 +169,46 @@ class Optimizer(ABC):
             Cost values.
 
         """
-        if (time.time() - self._opt_start_time) \
+        if (time.monotonic() - self._opt_start_time) \
                 > self.termination_conditions['max_wall_time']:
             raise WallTimeExceeded
 
-        costs = self.system_simulator.wrapped_cost_functions(
-            optimization_parameters.reshape(self.pulse_shape[::-1]).T)
+        pulse = self._unpack(optimization_parameters)
+
+        costs = self.system_simulator.wrapped_cost_functions(pulse)
 
         if self.save_intermediary_steps:
             self.optim_iter_summary.iter_num += 1
             self.optim_iter_summary.costs.append(costs)
-            self.optim_iter_summary.parameters.append(
-                optimization_parameters.reshape(self.pulse_shape[::-1]).T
-            )
-        if np.linalg.norm(costs) < np.linalg.norm(self._min_costs):
-            self._min_costs = costs
-            self._min_costs_par = optimization_parameters.reshape(
-                self.pulse_shape[::-1]).T
+            self.optim_iter_summary.parameters.append(pulse)
 
-        # apply the cost function weights after saving the values.
+        # apply the cost function weights after saving the values. The
+        # weighted costs are a new array, so that the output of the simulator
+        # is not modified.
         if self.cost_fktn_weights is not None:
-            costs *= self.cost_fktn_weights
+            costs = costs * self.cost_fktn_weights
+
+        objective = self._objective(costs)
+        if objective < self._min_objective:
+            self._min_objective = objective
+            # copy, because scipy may rescale the returned costs in place
+            self._min_costs = costs.copy()
+            # copy, because the pulse can be a view of the state of an
+            # annealer, which is modified in place by the next step
+            self._min_costs_par = pulse.copy()
 
         self._n_cost_fkt_eval += 1
         return costs
 
+    def _objective(self, costs: np.ndarray) -> float:
+        """The value minimized by the optimizer for the weighted costs.
+
+        It is used to keep track of the best costs found so far. The squared
+        norm of the costs is minimized, which saves the square root.
+
+        """
+        return np.dot(costs, costs)
+
     def cost_jacobian_wrapper(self, optimization_parameters):
         """Wraps the cost Jacobian function given by the simulator class.
 
@@ -193,25 +225,94 @@ class Optimizer(ABC):
             Jacobian of the cost functions.
 
         """
-        jacobian = self.system_simulator.wrapped_jac_function(
-            optimization_parameters.reshape(self.pulse_shape[::-1]).T)
+        pulse = self._unpack(optimization_parameters)
+
+        if self.use_jacobian_function:
+            jacobian = self.system_simulator.wrapped_jac_function(pulse)
+        else:
+            jacobian = self.system_simulator.numeric_gradient(
+                pulse=pulse, symmetric=True, processes=self.processes,
+                pool=self._pool)
 
         if self.save_intermediary_steps:
             self.optim_iter_summary.gradients.append(jacobian)
 
-        # jacobian shape (num_t, num_f, num_ctrl) -> (num_f, num_t * num_ctrl)
+        # jacobian shape (num_t, num_f, num_ctrl) -> (num_f, num_ctrl, num_t)
         jacobian = jacobian.transpose([1, 2, 0])
-        jacobian = jacobian.reshape(
-            (jacobian.shape[0], jacobian.shape[1] * jacobian.shape[2]))
 
-        # apply the cost function weights after saving the values.
+        # apply the cost function weights after saving the values. The
+        # transposed jacobian is copied to C order in the same pass, so
+        # the final reshape to (num_f, num_ctrl * num_t) is a view.
         if self.cost_fktn_weights is not None:
-            jacobian = np.einsum('ab, a -> ab', jacobian,
-                                 self.cost_fktn_weights)
+            jacobian = np.multiply(
+                jacobian, self.cost_fktn_weights[:, np.newaxis, np.newaxis],
+                order='C')
+        else:
+            jacobian = np.ascontiguousarray(jacobian)
+        jacobian = jacobian.reshape((jacobian.shape[0], -1))
 
         self._n_jac_fkt_eval += 1
         return jacobian
 
+    def _pack(self, pulse: np.ndarray) -> np.ndarray:
+        """Flattens a pulse to the optimization parameters used by scipy.
+
+        The parameters are ordered by control amplitude and then by time
+        step, which is the fortran order of the pulse.
+
+        Parameters
+        ----------
+        pulse: np.array, shape (num_t, num_ctrl)
+            The pulse.
+
+        Returns
+        -------
+        optimization_parameters: np.array, shape (num_t * num_ctrl)
+            The optimization parameters in a linear array. This is a view
+            of the pulse if it is fortran contiguous.
+
+        """
+        return pulse.ravel(order='F')
+
+    def _unpack(self, optimization_parameters: np.ndarray) -> np.ndarray:
+        """Reshapes the optimization parameters used by scipy to a pulse.
+
+        Inverts `_pack`.
+
+        Parameters
+        ----------
+        optimization_parameters: np.array, shape (num_t * num_ctrl)
+            Raw optimization parameters in a linear array.
+
+        Returns
+        -------
+        pulse: np.array, shape (num_t, num_ctrl)
+            The pulse as a view of the optimization parameters.
+
+        """
+        return optimization_parameters.reshape(self.pulse_shape, order='F')
+
+    @contextlib.contextmanager
+    def _finite_difference_pool(self):
+        """Keeps a pool of worker processes open for the finite differences.
+
+        The pool is only started if the jacobians are approximated in
+        parallel processes. It is reused by every jacobian evaluation within
+        the context, so that the simulator is sent to the workers only once
+        per optimization.
+
+        """
+        if self.use_jacobian_function or self.processes == 1:
+            yield
+            return
+
+        with self.system_simulator.create_pool(self.processes) as pool:
+            self._pool = pool
+            try:
+                yield
+            finally:
+                self._pool = None
+
     @abstractmethod
     def run_optimization(self, initial_control_amplitudes: np.ndarray) \
             -> optimization_data.OptimizationResult:
@@ -242,6 +343,7 @@ class Optimizer(ABC):
         Data stored in this class might be overwritten.
         """
         self._min_costs = np.inf
+        self._min_objective = np.inf
         self._min_costs_par = None
         self._n_cost_fkt_eval = 0
         self._n_jac_fkt_eval = 0
@@ -251,14 +353,15 @@ class Optimizer(ABC):
                 optimization_data.OptimizationSummary(
                     indices=self.system_simulator.cost_indices
                 )
-        self._opt_start_time = time.time()
+        # The monotonic clock is not affected by adjustments of the system
+        # time, which could otherwise end the optimization early or late.
+        self._opt_start_time = time.monotonic()
         if self.system_simulator.stats is not None:
             # If the system simulator wants to write down statistics, then
             # initialise a fresh instance
             self.system_simulator.stats = \
                 performance_statistics.PerformanceStatistics()
-            self.system_simulator.stats.start_t_opt = float(
-                self._opt_start_time)
+            self.system_simulator.stats.start_t_opt = time.time()
             self.system_simulator.stats.indices = \
                 self.system_simulator.cost_indices
 
@@ -277,9 +380,9 @@ class Optimizer(ABC):
         if self.system_simulator.stats is not None:
             self.system_simulator.stats.end_t_opt = time.time()
 
-        if self.use_jacobian_function:
+        if self.use_jacobian_function or self.processes != 1:
             jac_norm = np.linalg.norm(
-                self.cost_jacobian_wrapper(self._min_costs_par))
+                self.cost_jacobian_wrapper(self._pack(self._min_costs_par)))
         else:
             jac_norm = 0
 
@@ -321,6 +424,38 @@ class LeastSquaresOptimizer(Optimizer):
         The boundary conditions for the pulse optimizations. If none are given
         then the pulse is assumed to take any real value.
 
+    processes: int, optional
+        Number of processes for the finite differences if
+        use_jacobian_function is False. See the base class.
+
+    tr_solver: str, optional
+        Method for solving the trust region subproblems of scipy's 'trf' and
+        'dogbox' methods:
+        - 'exact': Uses a singular value or QR decomposition of the dense
+        jacobian. Its cost grows cubically with the number of optimization
+        parameters.
+        - 'lsmr': Uses the iterative scipy.sparse.linalg.lsmr solver, which
+        only requires matrix vector products with the jacobian.
+        If None, then 'exact' is used for up to 200 optimization parameters
+        and 'lsmr' otherwise. Defaults to None.
+
+    tr_options: dict, optional
+        Keyword options for the trust region solver. If None and the 'lsmr'
+        solver is used with the 'trf' method, then the subproblems are
+        regularized by {'regularize': True}. Defaults to None.
+
+    x_scale: float, array or 'jac', optional
+        Characteristic scale of each optimization parameter. If 'jac', then
+        the scale is updated iteratively from the inverse norms of the
+        jacobian's columns, which can help if the control amplitudes differ in
+        their orders of magnitude. Defaults to None, which uses the default
+        of scipy.optimize.least_squares for the chosen method.
+
+    loss: str or callable, optional
+        Loss function applied to the costs. The default 'linear' gives a
+        standard least squares problem. See scipy.optimize.least_squares for
+        robust alternatives, which are not supported by the 'lm' method.
+
     """
 
     def __init__(
@@ -331,14 +466,24 @@ class LeastSquaresOptimizer(Optimizer):
             method: str = 'trf',
             bounds: Union[np.ndarray, List, None] = None,
             use_jacobian_function=True,
-            cost_fktn_weights: Optional[Sequence[float]] = None):
+            cost_fktn_weights: Optional[Sequence[float]] = None,
+            processes: Optional[int] = 1,
+            tr_solver: Optional[str] = None,
+            tr_options: Optional[Dict] = None,
+            x_scale: Union[float, np.ndarray, str, None] = None,
+            loss: Union[str, Callable] = 'linear'):
         super().__init__(system_simulator=system_simulator,
                          termination_cond=termination_cond,
                          save_intermediary_steps=save_intermediary_steps,
                          cost_fktn_weights=cost_fktn_weights,
-                         use_jacobian_function=use_jacobian_function)
+                         use_jacobian_function=use_jacobian_function,
+                         processes=processes)
         self.method = method
         self.bounds = bounds
+        self.tr_solver = tr_solver
+        self.tr_options = tr_options
+        self.x_scale = x_scale
+        self.loss = loss
 
     def run_optimization(self, initial_control_amplitudes: np.array) \
             -> optimization_data.OptimizationResult:
@@ -346,42 +491,65 @@ class LeastSquaresOptimizer(Optimizer):
         super().prepare_optimization(
             initial_optimization_parameters=initial_control_amplitudes)
 
-        if self.use_jacobian_function:
+        if self.use_jacobian_function or self.processes != 1:
             jac = super().cost_jacobian_wrapper
         else:
             jac = '2-point'
 
-        try:
-            result = scipy.optimize.least_squares(
-                fun=super().cost_fktn_wrapper,
-                x0=initial_control_amplitudes.T.flatten(),
-                jac=jac,
-                bounds=self.bounds,
-                method=self.method,
-                ftol=self.termination_conditions["min_cost_gain"],
-                xtol=self.termination_conditions["min_amplitude_change"],
-                gtol=self.termination_conditions["min_gradient_norm"],
-                max_nfev=self.termination_conditions["max_iterations"]
-            )
+        tr_solver = self.tr_solver
+        tr_options = self.tr_options
+        if tr_solver is None:
+            if initial_control_amplitudes.size <= 200:
+                tr_solver = 'exact'
+            else:
+                tr_solver = 'lsmr'
+        if tr_options is None:
+            if tr_solver == 'lsmr' and self.method == 'trf':
+                tr_options = {'regularize': True}
+            else:
+                tr_options = {}
+
+        # The default of x_scale depends on the version of scipy, which only
+        # accepts None from version 1.16 on.
+        kwargs = {}
+        if self.x_scale is not None:
+            kwargs['x_scale'] = self.x_scale
+
+        with self._finite_difference_pool():
+            try:
+                result = scipy.optimize.least_squares(
+                    fun=super().cost_fktn_wrapper,
+                    x0=self._pack(initial_control_amplitudes),
+                    jac=jac,
+                    bounds=self.bounds,
+                    method=self.method,
+                    ftol=self.termination_conditions["min_cost_gain"],
+                    xtol=self.termination_conditions["min_amplitude_change"],
+                    gtol=self.termination_conditions["min_gradient_norm"],
+                    max_nfev=self.termination_conditions["max_iterations"],
+                    tr_solver=tr_solver,
+                    tr_options=tr_options,
+                    loss=self.loss,
+                    **kwargs
+                )
 
-            if self.system_simulator.stats is not None:
-                self.system_simulator.stats.end_t_opt = time.time()
+                if self.system_simulator.stats is not None:
+                    self.system_simulator.stats.end_t_opt = time.time()
 
-            optim_result = optimization_data.OptimizationResult(
-                final_cost=result.fun,
-                indices=self.system_simulator.cost_indices,
-                final_parameters=result.x.reshape(
-                    self.pulse_shape[::-1]).T,
-                final_grad_norm=np.linalg.norm(result.grad),
-                num_iter=result.nfev,
-                termination_reason=result.message,
-                status=result.status,
-                optimizer=self,
-                optim_summary=self.optim_iter_summary,
-                optimization_stats=self.system_simulator.stats
-            )
-        except WallTimeExceeded:
-            optim_result = self.write_state_to_result()
+                optim_result = optimization_data.OptimizationResult(
+                    final_cost=result.fun,
+                    indices=self.system_simulator.cost_indices,
+                    final_parameters=self._unpack(result.x),
+                    final_grad_norm=result.optimality,
+                    num_iter=result.nfev,
+                    termination_reason=result.message,
+                    status=result.status,
+                    optimizer=self,
+                    optim_summary=self.optim_iter_summary,
+                    optimization_stats=self.system_simulator.stats
+                )
+            except WallTimeExceeded:
+                optim_result = self.write_state_to_result()
 
         return optim_result
 
@@ -395,6 +563,10 @@ class ScalarMinimizingOptimizer(Optimizer):
     method: string
         Takes methods implemented by scipy.optimize.minimize.
 
+    processes: int, optional
+        Number of processes for the finite differences if
+        use_jacobian_function is False. See the base class.
+
     """
     def __init__(
             self,
@@ -404,13 +576,15 @@ class ScalarMinimizingOptimizer(Optimizer):
             method: str = 'L-BFGS-B',
             bounds: Union[np.ndarray, List, None] = None,
             use_jacobian_function=True,
-            cost_fktn_weights: Optional[Sequence[float]] = None
+            cost_fktn_weights: Optional[Sequence[float]] = None,
+            processes: Optional[int] = 1
     ):
         super().__init__(system_simulator=system_simulator,
                          termination_cond=termination_cond,
                          save_intermediary_steps=save_intermediary_steps,
                          cost_fktn_weights=cost_fktn_weights,
-                         use_jacobian_function=use_jacobian_function)
+                         use_jacobian_function=use_jacobian_function,
+                         processes=processes)
         self.method = method
         self.bounds = bounds
 
@@ -424,17 +598,29 @@ class ScalarMinimizingOptimizer(Optimizer):
         scalar_costs = np.sum(costs)
         return scalar_costs
 
+    def _objective(self, costs: np.ndarray) -> float:
+        """The sum of the weighted costs. """
+        return np.sum(costs)
+
+    def write_state_to_result(self):
+        """See base class. The final cost is the sum of the weighted costs,
+        like for a completed optimization. """
+        optim_result = super().write_state_to_result()
+        optim_result.final_cost = np.sum(optim_result.final_cost)
+        return optim_result
+
     def cost_jacobian_wrapper(self, optimization_parameters):
         """ The Jacobian reduced to the gradient.
 
         The gradient is calculated by summation over the Jacobian along the
         function axis, because the total cost function is defined as the sum
-        of cost functions.
+        of cost functions. (And not as the sum of squared costs like in the
+        least squares optimization.)
 
         Returns
         -------
         gradient: numpy array, shape (num_t * num_amp)
-            The gradient of the costs in the 2 norm.
+            The gradient of the sum of the weighted costs.
 
         """
         jac = super().cost_jacobian_wrapper(optimization_parameters)
@@ -447,49 +633,50 @@ class ScalarMinimizingOptimizer(Optimizer):
         super().prepare_optimization(
             initial_optimization_parameters=initial_control_amplitudes)
 
-        if self.use_jacobian_function:
+        if self.use_jacobian_function or self.processes != 1:
             jac = self.cost_jacobian_wrapper
         else:
             jac = None
 
         if self.method == 'L-BFGS-B':
-            try:
-                result = scipy.optimize.minimize(
-                    fun=self.cost_fktn_wrapper,
-                    x0=initial_control_amplitudes.T.flatten(),
-                    jac=jac,
-                    bounds=self.bounds,
-                    method=self.method,
-                    options={
-                        'ftol': self.termination_conditions["min_cost_gain"],
-                        'gtol': self.termination_conditions[
-                            "min_gradient_norm"],
-                        'maxiter': self.termination_conditions[
-                            "max_iterations"]
-                    }
-                )
-
-                optim_result = optimization_data.OptimizationResult(
-                    final_cost=result.fun,
-                    indices=self.system_simulator.cost_indices,
-                    final_parameters=result.x.reshape(
-                        self.pulse_shape[::-1]).T,
-                    final_grad_norm=np.linalg.norm(result.jac),
-                    num_iter=result.nfev,
-                    termination_reason=result.message,
-                    status=result.status,
-                    optimizer=self,
-                    optim_summary=self.optim_iter_summary,
-                    optimization_stats=self.system_simulator.stats
-                )
-            except WallTimeExceeded:
-                optim_result = self.write_state_to_result()
+            with self._finite_difference_pool():
+                try:
+                    result = scipy.optimize.minimize(
+                        fun=self.cost_fktn_wrapper,
+                        x0=self._pack(initial_control_amplitudes),
+                        jac=jac,
+                        bounds=self.bounds,
+                        method=self.method,
+                        options={
+                            'ftol': self.termination_conditions[
+                                "min_cost_gain"],
+                            'gtol': self.termination_conditions[
+                                "min_gradient_norm"],
+                            'maxiter': self.termination_conditions[
+                                "max_iterations"]
+                        }
+                    )
+
+                    optim_result = optimization_data.OptimizationResult(
+                        final_cost=result.fun,
+                        indices=self.system_simulator.cost_indices,
+                        final_parameters=self._unpack(result.x),
+                        final_grad_norm=np.linalg.norm(result.jac),
+                        num_iter=result.nfev,
+                        termination_reason=result.message,
+                        status=result.status,
+                        optimizer=self,
+                        optim_summary=self.optim_iter_summary,
+                        optimization_stats=self.system_simulator.stats
+                    )
+                except WallTimeExceeded:
+                    optim_result = self.write_state_to_result()
 
         elif self.method == 'Nelder-Mead':
             try:
                 result = scipy.optimize.minimize(
                     fun=self.cost_fktn_wrapper,
-                    x0=initial_control_amplitudes.T.flatten(),
+                    x0=self._pack(initial_control_amplitudes),
                     bounds=self.bounds,
                     method=self.method,
                     options={
@@ -500,8 +687,7 @@ class ScalarMinimizingOptimizer(Optimizer):
                 optim_result = optimization_data.OptimizationResult(
                     final_cost=result.fun,
                     indices=self.system_simulator.cost_indices,
-                    final_parameters=result.x.reshape(
-                        self.pulse_shape[::-1]).T,
+                    final_parameters=self._unpack(result.x),
                     num_iter=result.nfev,
                     termination_reason=result.message,
                     status=result.status,
@@ -516,7 +702,7 @@ class ScalarMinimizingOptimizer(Optimizer):
             try:
                 result = scipy.optimize.minimize(
                     fun=self.cost_fktn_wrapper,
-                    x0=initial_control_amplitudes.T.flatten(),
+                    x0=self._pack(initial_control_amplitudes),
                     bounds=self.bounds,
                     method=self.method
                 )
@@ -524,8 +710,7 @@ class ScalarMinimizingOptimizer(Optimizer):
                 optim_result = optimization_data.OptimizationResult(
                     final_cost=result.fun,
                     indices=self.system_simulator.cost_indices,
-                    final_parameters=result.x.reshape(
-                        self.pulse_shape[::-1]).T,
+                    final_parameters=self._unpack(result.x),
                     num_iter=result.nfev,
                     termination_reason=result.message,
                     status=result.status,
@@ -558,7 +743,13 @@ class PulseAnnealer(simanneal.Annealer):
     Tmax
     Tmin
     steps
-    updates
+    updates: int, optional
+        Number of progress updates printed during the annealing. If None, then
+        the default of simanneal (100) is used.
+    seed: int or numpy.random.Generator, optional
+        Seed for the random number generator drawing the steps and the
+        acceptance of the steps. Anything accepted by numpy.random.default_rng
+        can be given.
 
     """
     def __init__(
@@ -571,22 +762,27 @@ class PulseAnnealer(simanneal.Annealer):
             Tmax = 1.,
             Tmin = 1e-8,
             steps: int = 100,
-            updates: Optional[int] = None
+            updates: Optional[int] = None,
+            seed=None
     ):
         super().__init__(initial_state=state)
+        # The state is copied at least twice per step. The copy method of the
+        # pulse is much faster than the default copy.deepcopy.
+        self.copy_strategy = 'method'
         self.Tmax = Tmax
         self.Tmin = Tmin
         self.steps = steps
         if updates is not None:
             self.updates = updates
-        else:
-            self.updates = self.steps
 
         self.bounds = bounds
         self.step_size = step_size
         self.step_ratio = step_ratio
         self.energy_function = energy_function
 
+        self._rng = np.random.default_rng(seed)
+        self._update_mask = None
+
     def move(self):
         """Moving into a random direction. """
         pulse = self.state
@@ -598,30 +794,56 @@ class PulseAnnealer(simanneal.Annealer):
         if self.step_size == 0:
             raise ValueError("The step size has been set to 0.")
 
-        random_step = np.random.randint(
+        random_step = self._rng.integers(
             low=-1 * self.step_size,
             high=self.step_size + 1,
             size=pulse.shape
         )
 
-        # The update mask decides randomly which directions are neglected
-        update_mask = np.random.rand(*random_step.shape)
-        random_step[update_mask > self.step_ratio] = 0
-
-        new_pulse = pulse + random_step
-
-        # if a limit is exceeded, set the value to the limit
-        lower_limit_exceeded = new_pulse < self.bounds[0]
-        upper_limit_exceeded = new_pulse > self.bounds[1]
+        # The update mask decides randomly which directions are neglected. Its
+        # buffer is reused between the steps.
+        if self.step_ratio < 1:
+            if self._update_mask is None \
+                    or self._update_mask.shape != pulse.shape:
+                self._update_mask = np.empty(pulse.shape)
+            self._rng.random(out=self._update_mask)
+            random_step *= self._update_mask <= self.step_ratio
+
+        # The annealer only hands out copies of its state, so the pulse can
+        # be updated in place. If a limit is exceeded, the value is set to
+        # the limit.
+        np.add(pulse, random_step, out=pulse)
+        # The unsafe casting allows integer pulses with float bounds.
+        np.clip(pulse, self.bounds[0], self.bounds[1], out=pulse,
+                casting='unsafe')
+
+        self.state = pulse
+
+    def anneal(self):
+        """Minimizes the energy by simulated annealing.
+
+        simanneal draws the acceptance of the steps from the random module,
+        which is seeded from the random number generator of the annealer for
+        reproducible results. The previous state of the random module is
+        restored afterwards.
 
-        new_pulse[lower_limit_exceeded] = self.bounds[0][lower_limit_exceeded]
-        new_pulse[upper_limit_exceeded] = self.bounds[1][upper_limit_exceeded]
+        Returns
+        -------
+        state, energy: tuple
+            The best state and its energy found during the annealing.
 
-        self.state = new_pulse
+        """
+        random_state = random.getstate()
+        random.seed(int(self._rng.integers(2 ** 32)))
+        try:
+            return super().anneal()
+        finally:
+            random.setstate(random_state)
 
     def energy(self):
         """The energy or cost function of the annealer. """
-        return np.linalg.norm(self.energy_function(self.state.T.flatten()))
+        costs = self.energy_function(self.state.ravel(order='F'))
+        return np.sqrt(np.dot(costs, costs))
 
 
 class SimulatedAnnealing(Optimizer):
@@ -643,6 +865,23 @@ class SimulatedAnnealing(Optimizer):
         The boundary conditions for the pulse optimizations. bounds[0] should be
         the lower bounds, and bounds[1] the upper ones.
 
+    n_chains: int, optional
+        Number of independent annealing runs starting from the initial pulse.
+        The best final pulse is returned. If the intermediary steps are
+        saved, only those of the best chain are kept in the optimization
+        summary. Each chain is seeded independently from the random number
+        generator, so that the result does not depend on the number of
+        processes. Defaults to 1.
+
+    processes: int, optional
+        If an integer other than 1 is given, then the annealing chains are
+        run in this number of parallel processes. If None then cpu_count() is
+        called to use all cores available. The performance statistics are not
+        recorded for chains run in parallel. Defaults to 1.
+
+    seed: int or numpy.random.Generator, optional
+        Seed for the random number generator drawing the annealing steps.
+
     """
 
     def __init__(
@@ -655,13 +894,18 @@ class SimulatedAnnealing(Optimizer):
             step_size: int = 1,
             step_ratio: float = 1.,
             bounds: Optional[np.ndarray] = None,
-            updates: Optional[int] = None
+            updates: Optional[int] = None,
+            n_chains: int = 1,
+            processes: Optional[int] = 1,
+            seed=None
     ):
         super().__init__(
             system_simulator=system_simulator,
             termination_cond=termination_cond,
-            save_intermediary_steps=save_intermediary_steps
+            save_intermediary_steps=save_intermediary_steps,
+            processes=processes
         )
+        self.n_chains = n_chains
 
         self.annealer = PulseAnnealer(
             state=0,
@@ -672,7 +916,8 @@ class SimulatedAnnealing(Optimizer):
             Tmax=initial_temperature,
             Tmin=final_temperature,
             steps=termination_cond["max_iterations"],
-            updates=updates
+            updates=updates,
+            seed=seed
         )
 
     def run_optimization(self, initial_control_amplitudes: np.ndarray):
@@ -681,7 +926,27 @@ class SimulatedAnnealing(Optimizer):
         self.prepare_optimization(
             initial_optimization_parameters=initial_control_amplitudes)
 
-        pulse, costs = self.annealer.anneal()
+        if self.n_chains == 1:
+            pulse, costs = self.annealer.anneal()
+        else:
+            # The worker processes inherit the state of the random number
+            # generators, hence each chain is seeded independently.
+            seed_sequence = np.random.SeedSequence(
+                self.annealer._rng.integers(2 ** 32))
+            seeds = [int(child.generate_state(1)[0])
+                     for child in seed_sequence.spawn(self.n_chains)]
+            if self.processes == 1:
+                chain_results = [
+                    self._anneal_chain(initial_control_amplitudes, seed)
+                    for seed in seeds]
+            else:
+                with Pool(processes=self.processes,
+                          initializer=_set_worker_optimizer,
+                          initargs=(self, initial_control_amplitudes)) \
+                        as pool:
+                    chain_results = pool.map(_anneal_chain, seeds)
+            pulse, costs, self.optim_iter_summary = min(
+                chain_results, key=lambda result: result[1])
 
         if self.system_simulator.stats is not None:
             self.system_simulator.stats.end_t_opt = time.time()
@@ -700,7 +965,68 @@ class SimulatedAnnealing(Optimizer):
     def prepare_optimization(self, initial_optimization_parameters: np.ndarray):
         super().prepare_optimization(
             initial_optimization_parameters=initial_optimization_parameters)
-        self.annealer.state = initial_optimization_parameters
+        # copy, because the annealer modifies its state in place
+        self.annealer.state = initial_optimization_parameters.copy()
+
+    def _anneal_chain(self, initial_pulse: np.ndarray, seed: int):
+        """Runs an annealing chain starting from the initial pulse.
+
+        Parameters
+        ----------
+        initial_pulse: np.array, shape (num_t, num_ctrl)
+            The pulse at which the chain starts.
+
+        seed: int
+            Seed for the random number generator of the annealer.
+
+        Returns
+        -------
+        pulse, costs, optim_summary: tuple
+            The best pulse and its costs found in the chain and the summary
+            of the chain's intermediary steps, which is None if they are not
+            saved.
+
+        """
+        # The generator of the annealer is restored after the chain, so that
+        # later optimizations draw the same seeds as in worker processes.
+        rng = self.annealer._rng
+        self.annealer._rng = np.random.default_rng(seed)
+        self.annealer.state = initial_pulse.copy()
+        if self.save_intermediary_steps:
+            self.optim_iter_summary = \
+                optimization_data.OptimizationSummary(
+                    indices=self.system_simulator.cost_indices
+                )
+        try:
+            pulse, costs = self.annealer.anneal()
+        finally:
+            self.annealer._rng = rng
+        return pulse, costs, self.optim_iter_summary
+
+
+_worker_optimizer = None
+_worker_initial_pulse = None
+
+
+def _set_worker_optimizer(optimizer: SimulatedAnnealing,
+                          initial_pulse: np.ndarray) -> None:
+    """Stores the optimizer in a worker process of a multiprocessing.Pool.
+
+    The optimizer is handed over once per process instead of once per task.
+
+    """
+    global _worker_optimizer, _worker_initial_pulse
+    _worker_optimizer = optimizer
+    _worker_initial_pulse = initial_pulse
+
+
+def _anneal_chain(seed: int):
+    """Runs an annealing chain of the worker's optimizer.
+
+    See `SimulatedAnnealing._anneal_chain`.
+
+    """
+    return _worker_optimizer._anneal_chain(_worker_initial_pulse, seed)
 
 
 class SimulatedAnnealingScipy(Optimizer):
@@ -722,6 +1048,11 @@ class SimulatedAnnealingScipy(Optimizer):
         The boundary conditions for the pulse optimizations. bounds[0] should
         be the lower bounds, and bounds[1] the upper ones.
 
+    seed: int or numpy.random.Generator, optional
+        Seed for the random number generator drawing the steps and the
+        acceptance of the steps by scipy.optimize.basinhopping. Anything
+        accepted by numpy.random.default_rng can be given.
+
     """
 
     def __init__(
@@ -732,7 +1063,8 @@ class SimulatedAnnealingScipy(Optimizer):
             temperature: float = 1.,
             step_size: int = 1,
             interval: int = 50,
-            bounds: Optional[np.ndarray] = None
+            bounds: Optional[np.ndarray] = None,
+            seed=None
     ):
         super().__init__(
             system_simulator=system_simulator,
@@ -743,6 +1075,7 @@ class SimulatedAnnealingScipy(Optimizer):
         self.step_size = step_size
         self.interval = interval
         self.bounds = bounds
+        self._rng = np.random.default_rng(seed)
 
     def run_optimization(self, initial_control_amplitudes: np.ndarray):
         """See base class. """
@@ -753,14 +1086,15 @@ class SimulatedAnnealingScipy(Optimizer):
         try:
             result = scipy.optimize.basinhopping(
                 func=self.cost_fktn_wrapper,
-                x0=initial_control_amplitudes.T.flatten(),
+                x0=self._pack(initial_control_amplitudes),
                 niter=self.termination_conditions["max_iterations"],
                 T=self.temperature,
                 stepsize=self.step_size,
                 take_step=self._take_step,
                 callback=None,
                 interval=self.interval,
-                disp=True
+                disp=True,
+                seed=self._rng
             )
 
             if self.system_simulator.stats is not None:
@@ -769,10 +1103,9 @@ class SimulatedAnnealingScipy(Optimizer):
             optim_result = optimization_data.OptimizationResult(
                 final_cost=result.fun,
                 indices=self.system_simulator.cost_indices,
-                final_parameters=result.x.reshape(self.pulse_shape[::-1]).T,
+                final_parameters=self._unpack(result.x),
                 num_iter=result.nfev,
                 termination_reason=result.message,
-                status=result.status,
                 optimizer=self,
                 optim_summary=self.optim_iter_summary,
                 optimization_stats=self.system_simulator.stats
@@ -811,7 +1144,7 @@ class SimulatedAnnealingScipy(Optimizer):
             The pulse initial pulse plus a random variation.
 
         """
-        pulse = current_pulse.reshape(self.pulse_shape[::-1]).T
+        pulse = self._unpack(current_pulse)
 
         if type(self.step_size) != int:
             raise ValueError("The step size must be integer! But it is: "
@@ -820,19 +1153,18 @@ class SimulatedAnnealingScipy(Optimizer):
         if self.step_size == 0:
             raise ValueError("The step size has been set to 0.")
 
-        random_step = np.random.randint(
+        random_step = self._rng.integers(
             low=-1 * self.step_size,
             high=self.step_size + 1,
             size=pulse.shape
         )
 
-        new_pulse = pulse + random_step
-
-        # if a limit is exceeded, set the value to the limit
-        lower_limit_exceeded = new_pulse < self.bounds[0]
-        upper_limit_exceeded = new_pulse > self.bounds[1]
-
-        new_pulse[lower_limit_exceeded] = self.bounds[0][lower_limit_exceeded]
-        new_pulse[upper_limit_exceeded] = self.bounds[1][upper_limit_exceeded]
+        # basinhopping passes a copy of its current position, so the pulse
+        # can be updated in place. If a limit is exceeded, the value is set to
+        # the limit.
+        np.add(pulse, random_step, out=pulse)
+        # The unsafe casting allows integer pulses with float bounds.
+        np.clip(pulse, self.bounds[0], self.bounds[1], out=pulse,
+                casting='unsafe')
 
-        return new_pulse.T.flatten()
+        return self._pack(pulse)
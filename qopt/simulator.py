@@ -51,7 +51,8 @@ References
 
 """
 
-from typing import Optional, Sequence
+from typing import Iterable, Optional, Sequence
+from multiprocessing import Pool
 import numpy as np
 import time
 
@@ -282,6 +283,71 @@ class Simulator(object):
 
         return total_jac
 
+    def create_pool(self, processes: Optional[int] = None) -> Pool:
+        """
+        Starts a pool of worker processes which evaluate this simulator.
+
+        The simulator is sent to each worker once, when the pool is created.
+        The pool can be handed to `wrapped_cost_functions_batched` and
+        `numeric_gradient` for repeated evaluations and must be closed by the
+        caller, for example by using it as context manager.
+
+        Parameters
+        ----------
+        processes: int, optional
+            Number of worker processes. If None then cpu_count() is called to
+            use all cores available. Defaults to None.
+
+        Returns
+        -------
+        pool: multiprocessing.Pool
+            The pool of worker processes.
+
+        """
+        return Pool(processes=processes, initializer=_set_worker_simulator,
+                    initargs=(self, ))
+
+    def wrapped_cost_functions_batched(
+            self, pulses: Iterable[np.ndarray],
+            processes: Optional[int] = 1,
+            pool: Optional[Pool] = None
+    ) -> np.ndarray:
+        """
+        Evaluates the cost functions for a batch of pulses.
+
+        Parameters
+        ----------
+        pulses: numpy array or iterable, shape (n_pulses, num_t, num_ctrl)
+            The pulses at which the cost functions are evaluated. Any
+            iterable of pulses, for example a generator, can be given. It is
+            consumed lazily, so that not all pulses must be held in memory.
+
+        processes: int, optional
+            If an integer is given, then the pulses are evaluated in this
+            number of parallel processes. If 1 then no parallel computing is
+            applied. If None then cpu_count() is called to use all cores
+            available. Defaults to 1.
+
+        pool: multiprocessing.Pool, optional
+            A pool created by `create_pool` of this simulator. If given, the
+            pulses are evaluated in this pool and `processes` is ignored.
+
+        Returns
+        -------
+        costs: numpy array, shape (n_pulses, n_fun)
+            Array of costs (i.e. infidelities) for each pulse.
+
+        """
+        if pool is not None:
+            costs = list(pool.imap(_worker_cost_functions, pulses))
+        elif processes == 1:
+            costs = [self.wrapped_cost_functions(pulse=pulse)
+                     for pulse in pulses]
+        else:
+            with self.create_pool(processes) as pool:
+                costs = list(pool.imap(_worker_cost_functions, pulses))
+        return np.asarray(costs)
+
     def compare_numeric_to_analytic_gradient(
             self, pulse: Optional[np.ndarray] = None,
             delta_eps: float = 1e-8,
@@ -328,7 +394,9 @@ class Simulator(object):
     def numeric_gradient(
             self, pulse: Optional[np.ndarray] = None,
             delta_eps: float = 1e-8,
-            symmetric: bool = False
+            symmetric: bool = False,
+            processes: Optional[int] = 1,
+            pool: Optional[Pool] = None
     ) -> np.ndarray:
         """
         This function calculates the gradient numerically and analytically
@@ -346,6 +414,17 @@ class Simulator(object):
             If True, then the finite differences are evaluated symmetrically
             around the pulse. Otherwise by forward finite differences.
 
+        processes: int, optional
+            If an integer is given, then the finite differences are evaluated
+            in this number of parallel processes. If 1 then no parallel
+            computing is applied. If None then cpu_count() is called to use
+            all cores available. Defaults to 1.
+
+        pool: multiprocessing.Pool, optional
+            A pool created by `create_pool` of this simulator. If given, the
+            finite differences are evaluated in this pool and `processes` is
+            ignored.
+
         Returns
         -------
         gradients: array
@@ -357,24 +436,66 @@ class Simulator(object):
         else:
             test_pulse = pulse
 
-        central_costs = self.wrapped_cost_functions(pulse=test_pulse)
-
         n_times, n_operators = test_pulse.shape
-        n_cost_funcs = len(central_costs)
-
-        gradients = np.zeros((n_times, n_cost_funcs, n_operators))
-
-        for n_time in range(n_times):
-            for n_operator in range(n_operators):
-                delta = np.zeros_like(test_pulse)
-                delta[n_time, n_operator] = delta_eps
-                fwd_val = self.wrapped_cost_functions(test_pulse + delta)
-                if symmetric:
-                    bck_val = self.wrapped_cost_functions(test_pulse - delta)
-                    gradients[n_time, :, n_operator] = (fwd_val - bck_val) / (
-                            2 * delta_eps)
-                else:
-                    gradients[n_time, :, n_operator] = \
-                        (fwd_val - central_costs) / delta_eps
+        n_parameters = n_times * n_operators
+
+        flat_pulse = np.asarray(test_pulse, dtype=float).ravel()
+
+        def perturbed_pulses():
+            # The pulses are created one at a time, because all of them
+            # together would take memory quadratic in the number of
+            # parameters.
+            shifts = [delta_eps, -delta_eps] if symmetric else [delta_eps]
+            for shift in shifts:
+                for i in range(n_parameters):
+                    shifted_pulse = flat_pulse.copy()
+                    shifted_pulse[i] += shift
+                    yield shifted_pulse.reshape((n_times, n_operators))
+            if not symmetric:
+                yield flat_pulse.reshape((n_times, n_operators))
+
+        costs = self.wrapped_cost_functions_batched(
+            perturbed_pulses(), processes=processes, pool=pool)
+
+        if symmetric:
+            differences = (costs[:n_parameters] - costs[n_parameters:]) \
+                / (2 * delta_eps)
+        else:
+            differences = (costs[:n_parameters] - costs[n_parameters]) \
+                / delta_eps
+
+        # differences shape (n_times * n_operators, n_cost_funcs)
+        gradients = differences.reshape((n_times, n_operators, -1))
+        gradients = gradients.transpose([0, 2, 1])
 
         return gradients
+
+
+_worker_simulator = None
+
+
+def _set_worker_simulator(simulator: Simulator) -> None:
+    """Stores the simulator in a worker process of a multiprocessing.Pool.
+
+    The simulator is handed over once per process instead of once per task.
+
+    """
+    global _worker_simulator
+    _worker_simulator = simulator
+
+
+def _worker_cost_functions(pulse: np.ndarray) -> np.ndarray:
+    """Evaluates the cost functions of the worker's simulator.
+
+    Parameters
+    ----------
+    pulse: numpy array, shape (num_t, num_ctrl)
+        The pulse at which the costs are evaluated.
+
+    Returns
+    -------
+    costs: numpy array, shape (n_fun)
+        Array of costs (i.e. infidelities).
+
+    """
+    return _worker_simulator.wrapped_cost_functions(pulse=pulse)
@@ -156,3 +156,19 @@ class RabiTestCase(unittest.TestCase):
         _, rel_grad_deviation_qs_noise = dynamics_phase_control_qs_noise.\
             compare_numeric_to_analytic_gradient(inital_pulse)
         self.assertLess(rel_grad_deviation_qs_noise, 5e-5)
+
+    def test_parallel_numeric_gradient(self):
+        dynamics = Simulator(
+            solvers=[rabi.solver_qs_noise_xy, ],
+            cost_fktns=[rabi.entanglement_infid_xy,
+                        rabi.entanglement_infid_qs_noise_xy]
+        )
+
+        initial_pulse = rabi.random_xy_init_pulse(seed=1)
+
+        for symmetric in [False, True]:
+            serial_gradient = dynamics.numeric_gradient(
+                initial_pulse, symmetric=symmetric)
+            parallel_gradient = dynamics.numeric_gradient(
+                initial_pulse, symmetric=symmetric, processes=2)
+            np.testing.assert_allclose(serial_gradient, parallel_gradient)
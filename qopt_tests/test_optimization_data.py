@@ -0,0 +1,103 @@
+# Covers the ArrayLog that records the intermediary optimization steps
+
+import copy
+import pickle
+import unittest
+
+import numpy as np
+
+from qopt.optimization_data import ArrayLog
+
+
+class TestArrayLog(unittest.TestCase):
+    def test_empty(self):
+        log = ArrayLog()
+        self.assertEqual(len(log), 0)
+        self.assertEqual(list(log), [])
+        self.assertEqual(np.asarray(log).shape, (0, ))
+        with self.assertRaises(IndexError):
+            log[0]
+
+    def test_append_past_capacity(self):
+        arrays = [np.full((3, 2), i, dtype=float) for i in range(10)]
+        log = ArrayLog(capacity=4)
+        for array in arrays:
+            log.append(array)
+
+        self.assertEqual(len(log), 10)
+        np.testing.assert_array_equal(np.asarray(log), np.stack(arrays))
+
+        # a zero capacity is grown on the first append
+        log = ArrayLog(capacity=0)
+        log.append(arrays[0])
+        log.append(arrays[1])
+        np.testing.assert_array_equal(np.asarray(log), np.stack(arrays[:2]))
+
+    def test_append_copies(self):
+        array = np.zeros(3)
+        log = ArrayLog()
+        log.append(array)
+        array[0] = 1
+        np.testing.assert_array_equal(log[0], np.zeros(3))
+
+    def test_append_shape_mismatch(self):
+        log = ArrayLog()
+        log.append(np.zeros(3))
+        for array in [np.ones(1), 5., np.ones((1, 3))]:
+            with self.assertRaises(ValueError):
+                log.append(array)
+        self.assertEqual(len(log), 1)
+
+        # also after restoring a pickled log
+        log = pickle.loads(pickle.dumps(log))
+        with self.assertRaises(ValueError):
+            log.append(np.ones(1))
+
+    def test_indexing_and_iteration(self):
+        arrays = [np.arange(3) + i for i in range(5)]
+        log = ArrayLog(capacity=2)
+        for array in arrays:
+            log.append(array)
+
+        np.testing.assert_array_equal(log[0], arrays[0])
+        np.testing.assert_array_equal(log[-1], arrays[-1])
+        np.testing.assert_array_equal(log[1:3], np.stack(arrays[1:3]))
+        self.assertEqual(len(list(log)), len(arrays))
+        for recorded, array in zip(log, arrays):
+            np.testing.assert_array_equal(recorded, array)
+
+    def test_asarray(self):
+        log = ArrayLog()
+        log.append([1, 2])
+        log.append([3, 4])
+
+        np.testing.assert_array_equal(np.asarray(log), [[1, 2], [3, 4]])
+        self.assertEqual(np.asarray(log, dtype=float).dtype, float)
+
+        # only a copy detaches the array from the log
+        copied = np.array(log, copy=True)
+        copied[0, 0] = 0
+        self.assertEqual(log[0][0], 1)
+
+    def test_pickle_and_deepcopy(self):
+        log = ArrayLog(capacity=8)
+        log.append(np.zeros(2))
+        log.append(np.ones(2))
+
+        for restored in [pickle.loads(pickle.dumps(log)), copy.deepcopy(log)]:
+            np.testing.assert_array_equal(np.asarray(restored),
+                                          np.asarray(log))
+
+            restored.append(np.full(2, 2.))
+            restored.append(np.full(2, 3.))
+            self.assertEqual(len(restored), 4)
+            np.testing.assert_array_equal(
+                np.asarray(restored), [[0, 0], [1, 1], [2, 2], [3, 3]])
+
+            # the original log is not affected
+            self.assertEqual(len(log), 2)
+
+        restored = pickle.loads(pickle.dumps(ArrayLog()))
+        self.assertEqual(len(restored), 0)
+        restored.append(np.ones(2))
+        np.testing.assert_array_equal(np.asarray(restored), [[1, 1]])
@@ -1,9 +1,13 @@
 # Covers testing the scipy.minimize wrapper vs the scipy.least_squares_wrapper
 
 from qopt import *
+from qopt.optimize import PulseAnnealer, SimulatedAnnealing, \
+    SimulatedAnnealingScipy, default_termination_conditions
 from qopt.examples.rabi_driving import setup as rabi_setup
 import unittest
+import unittest.mock
 import numpy as np
+import scipy.optimize
 
 
 class TestOptimizers(unittest.TestCase):
@@ -56,3 +60,392 @@ class TestOptimizers(unittest.TestCase):
         self.assertLess(np.sum(result.final_cost), 1e-4)
         self.assertLess(np.sum(result_no_jac.final_cost), 1e-4)
         self.assertLess(np.sum(result_least_squres.final_cost), 2e-4)
+
+    def test_scalar_gradient_consistency(self):
+        simulator = Simulator(
+            solvers=[rabi_setup.solver_qs_noise_xy, ],
+            cost_fktns=[rabi_setup.entanglement_infid_xy,
+                        rabi_setup.entanglement_infid_qs_noise_xy]
+        )
+
+        optimizer = ScalarMinimizingOptimizer(
+            system_simulator=simulator,
+            cost_fktn_weights=[1, 1e2],
+            bounds=rabi_setup.bounds_xy
+        )
+
+        init_pulse = rabi_setup.random_xy_init_pulse(seed=1)
+        optimizer.prepare_optimization(init_pulse)
+        x0 = init_pulse.T.flatten()
+
+        gradient = optimizer.cost_jacobian_wrapper(x0)
+
+        delta_eps = 1e-6
+        numeric_gradient = np.zeros_like(gradient)
+        for i in range(x0.size):
+            delta = np.zeros_like(x0)
+            delta[i] = delta_eps
+            numeric_gradient[i] = (
+                optimizer.cost_fktn_wrapper(x0 + delta)
+                - optimizer.cost_fktn_wrapper(x0 - delta)) / (2 * delta_eps)
+
+        np.testing.assert_allclose(gradient, numeric_gradient, rtol=1e-4,
+                                   atol=1e-8)
+
+    def test_parallel_finite_differences(self):
+        simulator = Simulator(
+            solvers=[rabi_setup.solver_qs_noise_xy, ],
+            cost_fktns=[rabi_setup.entanglement_infid_xy,
+                        rabi_setup.entanglement_infid_qs_noise_xy]
+        )
+        termination_cond = dict(default_termination_conditions)
+        termination_cond["max_iterations"] = 20
+
+        optimizers = [
+            ScalarMinimizingOptimizer(
+                system_simulator=simulator,
+                termination_cond=termination_cond,
+                cost_fktn_weights=[1, 1e2],
+                bounds=rabi_setup.bounds_xy,
+                use_jacobian_function=False,
+                processes=2
+            ),
+            LeastSquaresOptimizer(
+                system_simulator=simulator,
+                termination_cond=termination_cond,
+                cost_fktn_weights=[1, 1e2],
+                bounds=rabi_setup.bounds_xy_least_sq,
+                use_jacobian_function=False,
+                processes=2
+            )
+        ]
+
+        init_pulse = rabi_setup.random_xy_init_pulse(seed=1)
+        init_costs = simulator.wrapped_cost_functions(init_pulse)
+
+        for optimizer in optimizers:
+            with unittest.mock.patch.object(
+                    simulator, 'create_pool',
+                    wraps=simulator.create_pool) as create_pool:
+                result = optimizer.run_optimization(init_pulse)
+
+            # one pool serves all jacobian evaluations of the optimization
+            self.assertEqual(create_pool.call_count, 1)
+            self.assertGreater(len(result.optim_summary.gradients), 1)
+            self.assertIsNone(optimizer._pool)
+            self.assertLess(np.sum(result.final_cost),
+                            np.sum(init_costs * [1, 1e2]))
+
+    def test_final_cost_weighting(self):
+        simulator = Simulator(
+            solvers=[rabi_setup.solver_qs_noise_xy, ],
+            cost_fktns=[rabi_setup.entanglement_infid_xy,
+                        rabi_setup.entanglement_infid_qs_noise_xy]
+        )
+        weights = np.array([1, 1e2])
+        init_pulse = rabi_setup.random_xy_init_pulse(seed=1)
+        x0 = init_pulse.ravel(order='F')
+        weighted_costs = simulator.wrapped_cost_functions(init_pulse) \
+            * weights
+
+        optimizer_least_squares = LeastSquaresOptimizer(
+            system_simulator=simulator,
+            cost_fktn_weights=weights,
+            bounds=rabi_setup.bounds_xy_least_sq
+        )
+        optimizer_scalar = ScalarMinimizingOptimizer(
+            system_simulator=simulator,
+            cost_fktn_weights=weights,
+            bounds=rabi_setup.bounds_xy
+        )
+
+        # the state written on an abort, e.g. by the wall time, reports the
+        # weighted costs like a completed optimization
+        for optimizer, final_cost in [
+                (optimizer_least_squares, weighted_costs),
+                (optimizer_scalar, np.sum(weighted_costs))]:
+            optimizer.prepare_optimization(init_pulse)
+            optimizer.cost_fktn_wrapper(x0)
+            result = optimizer.write_state_to_result()
+            np.testing.assert_allclose(result.final_cost, final_cost)
+            np.testing.assert_array_equal(result.final_parameters,
+                                          init_pulse)
+
+        result = optimizer_least_squares.run_optimization(init_pulse)
+        np.testing.assert_allclose(
+            result.final_cost,
+            simulator.wrapped_cost_functions(result.final_parameters)
+            * weights)
+
+        result = optimizer_scalar.run_optimization(init_pulse)
+        np.testing.assert_allclose(
+            result.final_cost,
+            np.sum(simulator.wrapped_cost_functions(result.final_parameters)
+                   * weights))
+
+    def test_least_squares_trust_region_solver(self):
+        simulator = Simulator(
+            solvers=[rabi_setup.solver_qs_noise_xy, ],
+            cost_fktns=[rabi_setup.entanglement_infid_xy, ]
+        )
+
+        def trust_region_arguments(n_parameters, **kwargs):
+            optimizer = LeastSquaresOptimizer(system_simulator=simulator,
+                                              **kwargs)
+            init_pulse = np.ones((n_parameters, 1))
+            result = scipy.optimize.OptimizeResult(
+                x=init_pulse.ravel(), fun=np.zeros(1), optimality=0.,
+                nfev=0, message='', status=0)
+            with unittest.mock.patch.object(
+                    scipy.optimize, 'least_squares',
+                    return_value=result) as least_squares:
+                optimizer.run_optimization(init_pulse)
+            call_kwargs = least_squares.call_args.kwargs
+            return call_kwargs['tr_solver'], call_kwargs['tr_options']
+
+        self.assertEqual(trust_region_arguments(200), ('exact', {}))
+        self.assertEqual(trust_region_arguments(201),
+                         ('lsmr', {'regularize': True}))
+        self.assertEqual(trust_region_arguments(201, method='dogbox'),
+                         ('lsmr', {}))
+
+        # explicit values override the defaults
+        self.assertEqual(trust_region_arguments(201, tr_solver='exact'),
+                         ('exact', {}))
+        self.assertEqual(trust_region_arguments(10, tr_solver='lsmr'),
+                         ('lsmr', {'regularize': True}))
+        self.assertEqual(
+            trust_region_arguments(201, tr_options={'regularize': False}),
+            ('lsmr', {'regularize': False}))
+
+    def test_least_squares_scaling_and_loss(self):
+        simulator = Simulator(
+            solvers=[rabi_setup.solver_qs_noise_xy, ],
+            cost_fktns=[rabi_setup.entanglement_infid_xy,
+                        rabi_setup.entanglement_infid_qs_noise_xy]
+        )
+        termination_cond = dict(default_termination_conditions)
+        termination_cond["max_iterations"] = 20
+        init_pulse = rabi_setup.random_xy_init_pulse(seed=1)
+        init_costs = simulator.wrapped_cost_functions(init_pulse)
+
+        optimizer = LeastSquaresOptimizer(
+            system_simulator=simulator,
+            termination_cond=termination_cond,
+            bounds=rabi_setup.bounds_xy_least_sq,
+            x_scale='jac',
+            loss='soft_l1'
+        )
+        with unittest.mock.patch.object(
+                scipy.optimize, 'least_squares',
+                wraps=scipy.optimize.least_squares) as least_squares:
+            result = optimizer.run_optimization(init_pulse)
+
+        call_kwargs = least_squares.call_args.kwargs
+        self.assertEqual(call_kwargs['x_scale'], 'jac')
+        self.assertEqual(call_kwargs['loss'], 'soft_l1')
+        self.assertLess(np.sum(result.final_cost), np.sum(init_costs))
+
+        # without an explicit scale, the default of scipy is used
+        optimizer = LeastSquaresOptimizer(
+            system_simulator=simulator,
+            termination_cond=termination_cond,
+            bounds=rabi_setup.bounds_xy_least_sq
+        )
+        with unittest.mock.patch.object(
+                scipy.optimize, 'least_squares',
+                wraps=scipy.optimize.least_squares) as least_squares:
+            optimizer.run_optimization(init_pulse)
+
+        self.assertNotIn('x_scale', least_squares.call_args.kwargs)
+
+
+class TestAnnealingSteps(unittest.TestCase):
+    def test_pulse_annealer_move(self):
+        lower = np.zeros((5, 2))
+        upper = np.full((5, 2), 2.5)
+        pulse = np.array([[0, 2]] * 5)
+
+        annealer = PulseAnnealer(
+            state=pulse.copy(),
+            bounds=np.stack([lower, upper]),
+            energy_function=lambda x: x,
+            step_size=2
+        )
+
+        for _ in range(20):
+            previous_pulse = annealer.state.copy()
+            annealer.move()
+            self.assertEqual(annealer.state.dtype, pulse.dtype)
+            self.assertTrue(np.all(annealer.state >= lower))
+            self.assertTrue(np.all(annealer.state <= upper))
+            self.assertTrue(
+                np.all(np.abs(annealer.state - previous_pulse) <= 2))
+
+    def test_scipy_annealing_take_step(self):
+        lower = np.zeros((5, 2))
+        upper = np.full((5, 2), 2.5)
+
+        optimizer = SimulatedAnnealingScipy(
+            bounds=np.stack([lower, upper]),
+            step_size=2
+        )
+        optimizer.pulse_shape = (5, 2)
+
+        x = np.array([[0., 2.]] * 5).ravel(order='F')
+        for _ in range(20):
+            new_x = optimizer._take_step(x.copy())
+            new_pulse = new_x.reshape((5, 2), order='F')
+            self.assertTrue(np.all(new_pulse >= lower))
+            self.assertTrue(np.all(new_pulse <= upper))
+            self.assertTrue(np.all(np.abs(new_x - x) <= 2))
+            x = new_x
+
+
+class TestSimulatedAnnealing(unittest.TestCase):
+    def test_annealing_chains(self):
+        simulator = Simulator(
+            solvers=[rabi_setup.solver_qs_noise_xy, ],
+            cost_fktns=[rabi_setup.entanglement_infid_xy, ]
+        )
+        termination_cond = dict(default_termination_conditions)
+        termination_cond["max_iterations"] = 30
+        init_pulse = np.ones((rabi_setup.n_time_samples, 2))
+        bounds = np.stack([np.zeros_like(init_pulse),
+                           np.full_like(init_pulse, rabi_setup.amp_bound)])
+
+        # Each optimizer runs twice, because the second run draws its seeds
+        # from the generator state left behind by the first run.
+        results = []
+        second_results = []
+        for processes in [1, 2]:
+            optimizer = SimulatedAnnealing(
+                system_simulator=simulator,
+                termination_cond=termination_cond,
+                save_intermediary_steps=True,
+                bounds=bounds,
+                updates=0,
+                n_chains=3,
+                processes=processes,
+                seed=1
+            )
+            results.append(optimizer.run_optimization(init_pulse))
+            second_results.append(optimizer.run_optimization(init_pulse))
+
+        for result in results + second_results:
+            # only the steps of the best chain are kept
+            chain_costs = np.asarray(result.optim_summary.costs)
+            self.assertLessEqual(len(chain_costs),
+                                 2 * termination_cond["max_iterations"])
+            self.assertAlmostEqual(
+                result.final_cost,
+                np.min(np.linalg.norm(chain_costs, axis=1)))
+
+        # the chains are seeded independently of the number of processes
+        np.testing.assert_array_equal(results[0].final_parameters,
+                                      results[1].final_parameters)
+        self.assertEqual(results[0].final_cost, results[1].final_cost)
+        np.testing.assert_array_equal(
+            np.asarray(results[0].optim_summary.costs),
+            np.asarray(results[1].optim_summary.costs))
+        np.testing.assert_array_equal(second_results[0].final_parameters,
+                                      second_results[1].final_parameters)
+        self.assertEqual(second_results[0].final_cost,
+                         second_results[1].final_cost)
+
+    def test_seed_reproducibility(self):
+        simulator = Simulator(
+            solvers=[rabi_setup.solver_qs_noise_xy, ],
+            cost_fktns=[rabi_setup.entanglement_infid_xy, ]
+        )
+        termination_cond = dict(default_termination_conditions)
+        termination_cond["max_iterations"] = 30
+        init_pulse = np.ones((rabi_setup.n_time_samples, 2))
+        bounds = np.stack([np.zeros_like(init_pulse),
+                           np.full_like(init_pulse, rabi_setup.amp_bound)])
+
+        results = []
+        for _ in range(2):
+            optimizer = SimulatedAnnealing(
+                system_simulator=simulator,
+                termination_cond=termination_cond,
+                save_intermediary_steps=True,
+                initial_temperature=1.,
+                final_temperature=1e-1,
+                bounds=bounds,
+                updates=0,
+                seed=1
+            )
+            results.append(optimizer.run_optimization(init_pulse))
+
+        np.testing.assert_array_equal(results[0].final_parameters,
+                                      results[1].final_parameters)
+        np.testing.assert_array_equal(
+            np.asarray(results[0].optim_summary.parameters),
+            np.asarray(results[1].optim_summary.parameters))
+
+    def test_scipy_seed_reproducibility(self):
+        simulator = Simulator(
+            solvers=[rabi_setup.solver_qs_noise_xy, ],
+            cost_fktns=[rabi_setup.entanglement_infid_xy, ]
+        )
+        termination_cond = dict(default_termination_conditions)
+        termination_cond["max_iterations"] = 3
+        init_pulse = np.ones((rabi_setup.n_time_samples, 2))
+        bounds = np.stack([np.zeros_like(init_pulse),
+                           np.full_like(init_pulse, rabi_setup.amp_bound)])
+
+        results = []
+        for _ in range(2):
+            optimizer = SimulatedAnnealingScipy(
+                system_simulator=simulator,
+                termination_cond=termination_cond,
+                save_intermediary_steps=True,
+                temperature=1e-2,
+                bounds=bounds,
+                seed=1
+            )
+            with unittest.mock.patch.object(
+                    scipy.optimize, 'basinhopping',
+                    wraps=scipy.optimize.basinhopping) as basinhopping:
+                results.append(optimizer.run_optimization(init_pulse))
+
+            # the acceptance of the steps is drawn from the same generator
+            self.assertIs(basinhopping.call_args.kwargs['seed'],
+                          optimizer._rng)
+
+        np.testing.assert_array_equal(results[0].final_parameters,
+                                      results[1].final_parameters)
+        np.testing.assert_array_equal(
+            np.asarray(results[0].optim_summary.parameters),
+            np.asarray(results[1].optim_summary.parameters))
+
+    def test_best_parameters_single_control(self):
+        # For a single control, the flattened pulse passed to the cost
+        # functions is a view of the annealer's state.
+        class SumSimulator:
+            cost_indices = ['sum']
+            stats = None
+
+            def wrapped_cost_functions(self, pulse):
+                return np.array([np.sum(pulse)])
+
+        simulator = SumSimulator()
+        termination_cond = dict(default_termination_conditions)
+        termination_cond["max_iterations"] = 50
+        init_pulse = np.full((6, 1), 3.)
+
+        optimizer = SimulatedAnnealing(
+            system_simulator=simulator,
+            termination_cond=termination_cond,
+            bounds=np.stack([np.zeros_like(init_pulse),
+                             np.full_like(init_pulse, 5.)]),
+            updates=0,
+            seed=1
+        )
+        optimizer.run_optimization(init_pulse)
+
+        np.testing.assert_array_equal(
+            simulator.wrapped_cost_functions(optimizer._min_costs_par),
+            optimizer._min_costs)
+